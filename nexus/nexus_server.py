@@ -1,25 +1,47 @@
 import os
+import hashlib
+import random
+import socket
+import threading
 import numpy as np
+from scipy.linalg import eigh
 import torch
 import jax
 import jax.numpy as jnp
-from pymilvus import connections, Collection, FieldSchema, CollectionSchema, DataType
+from pymilvus import connections, utility, Collection, FieldSchema, CollectionSchema, DataType
 import qutip as qt
 import networkx as nx
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from prometheus_client import start_http_server, Gauge, Counter
+from prometheus_client import (start_http_server, multiprocess, CollectorRegistry,
+                               REGISTRY, Gauge, Counter)
 import logging
 from pythonjsonlogger import jsonlogger
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel
 
+def _orjson_dumps(obj, default=None, **kwargs) -> str:
+    """
+    orjson-backed serializer for JsonFormatter
+
+    Non-string dict keys are stringified as json.dumps does. Output is
+    always UTF-8: stdlib-only options such as ensure_ascii and indent
+    are ignored.
+    """
+    # Values orjson cannot encode fall back to str(), like the stdlib
+    # encoder JsonFormatter uses
+    return orjson.dumps(obj, default=default or str,
+                        option=orjson.OPT_NON_STR_KEYS).decode()
+
 # Configure logging
 logger = logging.getLogger()
 logHandler = logging.StreamHandler()
-formatter = jsonlogger.JsonFormatter()
+formatter = jsonlogger.JsonFormatter(json_serializer=_orjson_dumps)
 logHandler.setFormatter(formatter)
 logger.addHandler(logHandler)
 logger.setLevel(logging.INFO)
@@ -30,30 +52,63 @@ PATTERN_SYNTHESES = Counter('pattern_syntheses_total', 'Number of pattern synthe
 VECTOR_SEARCHES = Counter('vector_searches_total', 'Number of vector searches performed')
 SYSTEM_MEMORY = Gauge('system_memory_usage_bytes', 'Current system memory usage')
 
+# Fixed Hamiltonian driving pattern synthesis and state evolution
+SYNTHESIS_HAMILTONIAN = qt.sigmax() + qt.sigmay() + qt.sigmaz()
+
+# Vector index types selectable through VECTOR_INDEX_TYPE
+SUPPORTED_INDEX_TYPES = ('HNSW', 'DISKANN', 'IVF_PQ')
+
+# IVF_PQ sub-quantizers per vector; must divide VECTOR_DIMENSION
+IVF_PQ_M = 16
+
+# Vector field type and client dtype per VECTOR_PRECISION
+VECTOR_PRECISIONS = {
+    'float32': (DataType.FLOAT_VECTOR, np.float32),
+    'float16': (DataType.FLOAT16_VECTOR, np.float16)
+}
+
 class NexusPrime:
     def __init__(self):
         self.dimension = int(os.getenv('VECTOR_DIMENSION', '512'))
         self.clustering_enabled = os.getenv('CLUSTERING_ENABLED', 'true').lower() == 'true'
         
+        # HNSW build parameters; recall gains flatten past efConstruction
+        # of ~64-128 while build time grows roughly linearly with it
+        self.hnsw_m = int(os.getenv('HNSW_M', '16'))
+        self.hnsw_ef_construction = int(os.getenv('HNSW_EF_CONSTRUCTION', '64'))
+        
+        # HNSW search candidate list size; trades query latency for recall
+        self.hnsw_ef = int(os.getenv('HNSW_EF', '64'))
+        
+        # Shards let Milvus spread ingest and index build across nodes
+        self.shards_num = int(os.getenv('COLLECTION_SHARDS', '1'))
+        
         # Initialize quantum layers
         self.quantum_layers = {
             'coherent': torch.nn.Parameter(torch.randn(self.dimension)),
             'entangled': torch.nn.Parameter(torch.randn(self.dimension, self.dimension))
         }
         
-        # Collection parameters for new Faiss-based HNSW
+        # In-memory HNSW by default; DISKANN keeps the graph and full
+        # vectors on local SSD with only compressed codes held in RAM, and
+        # IVF_PQ stores IVF_PQ_M one-byte product-quantized codes per vector
+        self.index_type = os.getenv('VECTOR_INDEX_TYPE', 'HNSW').upper()
+        if self.index_type not in SUPPORTED_INDEX_TYPES:
+            raise ValueError(f"Unsupported VECTOR_INDEX_TYPE: {self.index_type}")
+        
+        # float16 halves vector memory and search bandwidth; opt-in as it
+        # only applies to collections created after the switch
+        self.vector_precision = os.getenv('VECTOR_PRECISION', 'float32').lower()
+        if self.vector_precision not in VECTOR_PRECISIONS:
+            raise ValueError(f"Unsupported VECTOR_PRECISION: {self.vector_precision}")
+        self.vector_type, self.vector_dtype = VECTOR_PRECISIONS[self.vector_precision]
+        
+        # Collection index parameters
         self.collection_params = {
             'dimension': self.dimension,
-            'index_type': 'HNSW',
+            'index_type': self.index_type,
             'metric_type': 'L2',
-            'params': {
-                'M': 16,
-                'efConstruction': 200,
-                'quantization': {
-                    'type': 'PRQ',
-                    'nbits': 8
-                }
-            }
+            'params': self._index_build_params()
         }
         
         # Clustering configuration
@@ -69,29 +124,113 @@ class NexusPrime:
         # Initialize quantum state
         self.psi = qt.basis([2, 2], [0, 0])
         
-        # Setup pattern synthesis graph
+        # Endpoints run concurrently in FastAPI's threadpool; this lock
+        # guards the pattern graph and the spectrum cache, and loading
+        # collections has its own so a slow load does not block evolution
+        self._lock = threading.Lock()
+        self._collections_lock = threading.Lock()
+        
+        # Setup pattern synthesis graph, bounded by evicting the oldest
+        # nodes so a long-running server does not grow without limit
         self.pattern_graph = nx.Graph()
+        self.pattern_graph_max_nodes = int(os.getenv('PATTERN_GRAPH_MAX_NODES', '10000'))
+        self._pattern_nodes = deque()
+        
+        # Loaded Milvus collections, reused across requests
+        self._collections: Dict[str, Collection] = {}
+        
+        # Eigendecompositions of evolution Hamiltonians, keyed by id()
+        self._spectra: Dict[int, Tuple] = {}
         
         logger.info("NexusPrime initialized", extra={
             'dimension': self.dimension,
-            'clustering_enabled': self.clustering_enabled
+            'clustering_enabled': self.clustering_enabled,
+            'index_type': self.index_type,
+            'vector_precision': self.vector_precision,
+            'hnsw_m': self.hnsw_m,
+            'hnsw_ef_construction': self.hnsw_ef_construction,
+            'hnsw_ef': self.hnsw_ef,
+            'shards_num': self.shards_num
         })
 
-    def setup_milvus(self):
-        """Initialize Milvus connection and collections"""
-        try:
-            connections.connect(
-                host=os.getenv('MILVUS_HOST', 'standalone'),
-                port=os.getenv('MILVUS_PORT', '19530')
+    def _index_build_params(self) -> Dict:
+        """Build parameters for the configured index type"""
+        if self.index_type == 'HNSW':
+            return {'M': self.hnsw_m, 'efConstruction': self.hnsw_ef_construction}
+        if self.index_type == 'IVF_PQ':
+            return {'nlist': 1024, 'm': IVF_PQ_M, 'nbits': 8}
+        # DISKANN build settings live in the server's milvus.yaml
+        return {}
+
+    def _create_index(self, collection: Collection):
+        """Build the configured vector index on a collection"""
+        if self.index_type == 'IVF_PQ' and self.dimension % IVF_PQ_M:
+            raise ValueError(
+                f"IVF_PQ requires VECTOR_DIMENSION divisible by {IVF_PQ_M}, "
+                f"got {self.dimension}"
             )
-            self.setup_collections()
-            logger.info("Milvus connection established")
-        except Exception as e:
-            logger.error("Milvus connection failed", extra={'error': str(e)})
-            raise
+        collection.create_index(
+            field_name="vector",
+            index_params=self.collection_params
+        )
+
+    def _search_params(self, top_k: int) -> Dict:
+        """Search parameters matching the configured index type"""
+        # Graph candidate list sizes must be at least top_k
+        if self.index_type == 'HNSW':
+            params = {'ef': max(top_k, self.hnsw_ef)}
+        elif self.index_type == 'IVF_PQ':
+            params = {'nprobe': 16}
+        else:
+            params = {'search_list': max(top_k, 100)}
+        return {'metric_type': 'L2', 'params': params}
+
+    def setup_milvus(self, max_attempts: int = 10):
+        """Initialize Milvus connection and collections"""
+        # Reuse an open connection, e.g. when NexusPrime is re-created in
+        # a long-running process, instead of repeating the handshake
+        if not connections.has_connection("default"):
+            self._connect_milvus(max_attempts)
+        
+        self.setup_collections()
+        logger.info("Milvus connection established")
+
+    def _connect_milvus(self, max_attempts: int):
+        """Open the default Milvus connection, waiting for the server"""
+        host = os.getenv('MILVUS_HOST', 'standalone')
+        port = os.getenv('MILVUS_PORT', '19530')
+        
+        # Retry with jittered exponential backoff, capped at 5s, so a
+        # server that comes up quickly is picked up within a fraction of
+        # a second rather than after a fixed sleep
+        delay = 0.1
+        for attempt in range(1, max_attempts + 1):
+            try:
+                # Cheap TCP probe first: a closed port fails immediately
+                # instead of waiting out the gRPC handshake timeout
+                with socket.create_connection((host, int(port)), timeout=0.5):
+                    pass
+                connections.connect(host=host, port=port)
+                return
+            except Exception as e:
+                if attempt == max_attempts:
+                    logger.error("Milvus connection failed", extra={'error': str(e)})
+                    raise
+                logger.warning("Milvus not ready, retrying", extra={
+                    'attempt': attempt,
+                    'error': str(e)
+                })
+                time.sleep(delay + random.random() * 0.1)
+                delay = min(delay * 2, 5.0)
 
     def setup_collections(self):
         """Setup Milvus collections with new 2.5 features"""
+        # An existing collection keeps its schema and index across
+        # restarts; one listing call replaces re-declaring and re-indexing
+        if "quantum_states" in utility.list_collections():
+            self._reuse_collection(Collection("quantum_states"))
+            return
+        
         fields = [
             FieldSchema(name="id", dtype=DataType.INT64, is_primary=True),
             FieldSchema(
@@ -102,7 +241,7 @@ class NexusPrime:
             ),
             FieldSchema(
                 name="vector",
-                dtype=DataType.FLOAT_VECTOR,
+                dtype=self.vector_type,
                 dim=self.dimension
             ),
             FieldSchema(
@@ -121,24 +260,126 @@ class NexusPrime:
             collection = Collection(
                 name="quantum_states",
                 schema=schema,
+                shards_num=self.shards_num,
                 clustering=self.clustering_config if self.clustering_enabled else None
             )
             
-            # Create HNSW index with new Faiss backend
-            collection.create_index(
-                field_name="vector",
-                index_params=self.collection_params
-            )
+            # Create the configured vector index
+            self._create_index(collection)
             logger.info("Collection and index created successfully")
         except Exception as e:
             logger.error("Collection setup failed", extra={'error': str(e)})
             raise
 
-    def quantum_evolution(self, state, hamiltonian):
+    def _reuse_collection(self, collection: Collection):
+        """
+        Adopt the vector precision and index type of an existing collection
+
+        Searches must match the stored field type and index, so these take
+        precedence over VECTOR_PRECISION and VECTOR_INDEX_TYPE. The stored
+        dimension must match VECTOR_DIMENSION. A missing index, e.g. after
+        an interrupted first start, is created.
+        """
+        field = next(f for f in collection.schema.fields if f.name == "vector")
+        stored_dim = int(field.params['dim'])
+        if stored_dim != self.dimension:
+            raise ValueError(
+                f"VECTOR_DIMENSION is {self.dimension} but {collection.name} "
+                f"stores {stored_dim}-dim vectors"
+            )
+        precision = next(
+            (name for name, (dtype, _) in VECTOR_PRECISIONS.items() if dtype == field.dtype),
+            None
+        )
+        if precision is None:
+            raise ValueError(f"Unsupported vector field type in {collection.name}: {field.dtype}")
+        if precision != self.vector_precision:
+            logger.warning("Using existing collection's vector precision", extra={
+                'configured': self.vector_precision,
+                'collection': precision
+            })
+            self.vector_precision = precision
+            self.vector_type, self.vector_dtype = VECTOR_PRECISIONS[precision]
+        
+        if not collection.has_index():
+            self._create_index(collection)
+            logger.info("Index created on existing collection")
+        else:
+            index_type = collection.index().params.get('index_type')
+            if index_type not in SUPPORTED_INDEX_TYPES:
+                raise ValueError(f"Unsupported index type in {collection.name}: {index_type}")
+            if index_type != self.index_type:
+                logger.warning("Using existing collection's index type", extra={
+                    'configured': self.index_type,
+                    'collection': index_type
+                })
+                self.index_type = index_type
+        
+        logger.info("Using existing collection", extra={
+            'collection': collection.name,
+            'vector_precision': self.vector_precision,
+            'index_type': self.index_type
+        })
+
+    def quantum_evolution(self, state, hamiltonian, dt: float = 0.1):
         """Quantum state evolution under given Hamiltonian"""
         QUANTUM_OPERATIONS.inc()
-        U = (-1j * hamiltonian * 0.1).expm()
-        return U * state
+        evolved = self._propagate(hamiltonian, state.full(), dt)
+        return qt.Qobj(evolved, dims=state.dims)
+
+    def quantum_evolution_batch(self, states: np.ndarray, hamiltonian,
+                                dt: float = 0.1) -> np.ndarray:
+        """
+        Evolve a batch of kets stored as the columns of a (d, B) array
+
+        All columns share one pair of matrix-matrix products instead of
+        B separate evolutions.
+        """
+        states = np.asarray(states)
+        if states.ndim != 2:
+            raise ValueError(f"states must be a (d, B) array, got shape {states.shape}")
+        if states.shape[0] != hamiltonian.shape[0]:
+            raise ValueError(
+                f"state dimension {states.shape[0]} does not match "
+                f"Hamiltonian dimension {hamiltonian.shape[0]}"
+            )
+        QUANTUM_OPERATIONS.inc(states.shape[1])
+        return self._propagate(hamiltonian, states, dt)
+
+    def _propagate(self, hamiltonian, columns: np.ndarray,
+                   dt: float) -> np.ndarray:
+        """Apply U = exp(-iH·dt) to each column of a dense array"""
+        # eigh reads only one triangle, so general operators take the
+        # full matrix exponential instead
+        if not hamiltonian.isherm:
+            return (-1j * hamiltonian * dt).expm().full() @ columns
+        
+        # H is Hermitian: propagate in its eigenbasis,
+        # U|ψ⟩ = V exp(-iΛt) V†|ψ⟩, without materializing U. The cached
+        # spectrum serves any dt; only the phase vector is recomputed
+        w, V = self._spectrum(hamiltonian)
+        return V @ (np.exp(-1j * w * dt)[:, None] * (V.conj().T @ columns))
+
+    def _spectrum(self, hamiltonian) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Eigendecomposition of a Hamiltonian, cached per Qobj instance
+
+        Hamiltonians are treated as immutable. Each entry holds a reference
+        to its Qobj so the id() key cannot be recycled while cached.
+        """
+        with self._lock:
+            cached = self._spectra.get(id(hamiltonian))
+        if cached is None or cached[0] is not hamiltonian:
+            # Decompose outside the lock; a concurrent miss on the same
+            # Hamiltonian only repeats the work
+            # MRRR driver; H is built in-process, so skip the finiteness scan
+            w, V = eigh(hamiltonian.full(), driver='evr', check_finite=False)
+            cached = (hamiltonian, w, V)
+            with self._lock:
+                if len(self._spectra) >= 32:
+                    self._spectra.pop(next(iter(self._spectra)))
+                self._spectra[id(hamiltonian)] = cached
+        return cached[1], cached[2]
         
     def pattern_synthesis(self, input_pattern):
         """Synthesize patterns using quantum-classical hybrid approach"""
@@ -148,42 +389,105 @@ class NexusPrime:
         q_pattern = qt.Qobj(input_pattern)
         
         # Evolve quantum state
-        H = qt.sigmax() + qt.sigmay() + qt.sigmaz()
-        evolved = self.quantum_evolution(q_pattern, H)
+        evolved = self.quantum_evolution(q_pattern, SYNTHESIS_HAMILTONIAN)
         
         # Project back to classical domain
         classical = np.array(evolved.full())
         
         # Update pattern graph
-        self.pattern_graph.add_edge(
-            str(input_pattern),
-            str(classical),
+        self._add_pattern_edge(
+            self.pattern_key(input_pattern),
+            self.pattern_key(classical),
             weight=float(np.abs(evolved.norm()))
         )
         
         return classical
 
+    def _add_pattern_edge(self, source: int, target: int, weight: float):
+        """Add a synthesis edge, evicting the oldest nodes past the cap"""
+        with self._lock:
+            for node in (source, target):
+                if node not in self.pattern_graph:
+                    self.pattern_graph.add_node(node)
+                    self._pattern_nodes.append(node)
+            self.pattern_graph.add_edge(source, target, weight=weight)
+            
+            while len(self._pattern_nodes) > self.pattern_graph_max_nodes:
+                self.pattern_graph.remove_node(self._pattern_nodes.popleft())
+
+    @staticmethod
+    def pattern_key(pattern: np.ndarray) -> int:
+        """Stable 64-bit graph key from a pattern's dtype, shape and contents"""
+        data = np.ascontiguousarray(pattern)
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f"{data.dtype.str}{data.shape}".encode())
+        digest.update(data)
+        return int.from_bytes(digest.digest(), 'little')
+
+    def collection(self, name: str) -> Collection:
+        """
+        Return a loaded handle to a Milvus collection
+
+        Collections are loaded into query nodes on first use and stay
+        loaded, so searches do not pay a load/release round trip each.
+        """
+        with self._collections_lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                collection = Collection(name)
+                collection.load()
+                self._collections[name] = collection
+        return collection
+
     def search_similar_states(self, query_state, collection_name="quantum_states", top_k=5):
         """Search for similar states in Milvus"""
         VECTOR_SEARCHES.inc()
-        collection = Collection(collection_name)
-        collection.load()
+        # Match the vector field's precision once here instead of sending
+        # float64 over the wire for the client to downcast
+        query = np.asarray(query_state, dtype=self.vector_dtype).ravel()
+        collection = self.collection(collection_name)
         try:
             results = collection.search(
-                data=[query_state.flatten()],
+                data=[query],
                 anns_field="vector",
-                param={"metric_type": "L2", "params": {"nprobe": 16}},
+                param=self._search_params(top_k),
                 limit=top_k
             )
             return results
         except Exception as e:
             logger.error("Search failed", extra={'error': str(e)})
             raise
-        finally:
-            collection.release()
+
+# NexusPrime connects to Milvus, so it is created on application
+# startup rather than as a side effect of importing this module
+nexus: Optional[NexusPrime] = None
+
+def start_metrics_server(port: int = 8000):
+    """Serve Prometheus metrics, aggregated across uvicorn workers"""
+    registry = REGISTRY
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        # Workers write their samples to the shared directory; whichever
+        # worker binds the port reports the sum over all of them
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    try:
+        start_http_server(port, registry=registry)
+    except OSError:
+        logger.info("Metrics served by another worker", extra={'port': port})
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize NexusPrime and the metrics exporter; close Milvus on exit"""
+    global nexus
+    start_metrics_server()
+    nexus = NexusPrime()
+    try:
+        yield
+    finally:
+        connections.disconnect("default")
 
 # FastAPI app initialization
-app = FastAPI(title="NEXUS_PRIME API")
+app = FastAPI(title="NEXUS_PRIME API", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -194,13 +498,27 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize NexusPrime
-nexus = NexusPrime()
-
 class QuantumState(BaseModel):
     state_vector: List[float]
     metadata: Optional[Dict] = None
 
+class ComplexVector(BaseModel):
+    """Complex vector split into JSON-serializable real and imaginary parts"""
+    real: List[float]
+    imag: List[float]
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "ComplexVector":
+        values = np.asarray(values).ravel()
+        return cls(real=values.real.tolist(), imag=values.imag.tolist())
+
+class EvolvedState(BaseModel):
+    evolved_state: ComplexVector
+    norm: float
+
+class SynthesizedPattern(BaseModel):
+    synthesized_pattern: ComplexVector
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -209,59 +527,55 @@ async def health_check():
 @app.get("/metrics")
 async def get_metrics():
     """Expose metrics for Milvus WebUI"""
-    collection = Collection("quantum_states")
-    collection.load()
-    try:
-        return {
-            "system_status": "healthy",
-            "collections": {
-                "quantum_states": {
-                    "total_entities": collection.num_entities,
-                    "index_status": "built",
-                    "clustering_status": "optimized" if nexus.clustering_enabled else "disabled"
-                }
+    collection = nexus.collection("quantum_states")
+    return {
+        "system_status": "healthy",
+        "collections": {
+            "quantum_states": {
+                "total_entities": collection.num_entities,
+                "index_status": "built",
+                "clustering_status": "optimized" if nexus.clustering_enabled else "disabled"
             }
         }
-    finally:
-        collection.release()
+    }
 
-@app.post("/quantum/evolve")
-async def evolve_state(state: QuantumState):
+# The evolve and synthesize endpoints are plain functions so FastAPI runs
+# them in its worker threadpool; their NumPy/LAPACK work releases the GIL,
+# so concurrent requests evolve in parallel instead of queuing on the
+# event loop. NexusPrime locks its shared caches and pattern graph
+@app.post("/quantum/evolve", response_model=EvolvedState)
+def evolve_state(state: QuantumState):
     """Evolve quantum state endpoint"""
     try:
         # Convert input to quantum state
         q_state = qt.Qobj(np.array(state.state_vector))
         
-        # Create Hamiltonian
-        H = qt.sigmax() + qt.sigmay() + qt.sigmaz()
-        
         # Evolve state
-        evolved = nexus.quantum_evolution(q_state, H)
+        evolved = nexus.quantum_evolution(q_state, SYNTHESIS_HAMILTONIAN)
         
-        return {
-            "evolved_state": evolved.full().flatten().tolist(),
-            "norm": float(evolved.norm())
-        }
+        return EvolvedState(
+            evolved_state=ComplexVector.from_array(evolved.full()),
+            norm=float(evolved.norm())
+        )
     except Exception as e:
         logger.error("Evolution failed", extra={'error': str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/pattern/synthesize")
-async def synthesize_pattern(state: QuantumState):
+@app.post("/pattern/synthesize", response_model=SynthesizedPattern)
+def synthesize_pattern(state: QuantumState):
     """Pattern synthesis endpoint"""
     try:
         pattern = np.array(state.state_vector)
         synthesized = nexus.pattern_synthesis(pattern)
-        return {
-            "synthesized_pattern": synthesized.flatten().tolist()
-        }
+        return SynthesizedPattern(
+            synthesized_pattern=ComplexVector.from_array(synthesized)
+        )
     except Exception as e:
         logger.error("Pattern synthesis failed", extra={'error': str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
-    # Start Prometheus metrics server
-    start_http_server(8000)
-    
-    # Start FastAPI server
+    # Start FastAPI server in-process. Multiple workers are started through
+    # the uvicorn CLI instead (see Dockerfile.nexus), which imports this
+    # module once per worker rather than again alongside __main__
     uvicorn.run(app, host="0.0.0.0", port=5000)
\ No newline at end of file
@@ -14,8 +14,20 @@ import numpy as np
 from scipy.special import sph_harm, genlaguerre
 from numba import jit
 from dataclasses import dataclass
+from functools import lru_cache
+from math import factorial
 from typing import Tuple, Optional
 
+# Spherical grid for hydrogen eigenstates. Sparse axes broadcast to the
+# full (θ, r, φ) grid, so each factor of R(r)Y_{lm}(θ,φ) is evaluated
+# only on the coordinates it depends on.
+R_GRID, THETA_GRID, PHI_GRID = np.meshgrid(
+    np.linspace(0, 20, 100),
+    np.linspace(0, np.pi, 50),
+    np.linspace(0, 2*np.pi, 50),
+    sparse=True
+)
+
 @dataclass
 class QuantumState:
     """Represents a quantum state with associated quantum numbers"""
@@ -26,8 +38,12 @@ class QuantumState:
     
     def __post_init__(self):
         """Normalize the wavefunction"""
-        norm = np.sqrt(np.vdot(self.wavefunction, self.wavefunction))
-        self.wavefunction = self.wavefunction / norm
+        # ⟨ψ|ψ⟩ is real; scaling by a real reciprocal avoids a
+        # complex division per element
+        norm = np.sqrt(np.vdot(self.wavefunction, self.wavefunction).real)
+        if norm == 0 or not np.isfinite(norm):
+            raise ValueError("Wavefunction must have a finite, non-zero norm")
+        self.wavefunction = self.wavefunction * (1.0 / norm)
     
     @classmethod
     def hydrogen_state(cls, n: int, l: int, m: int) -> 'QuantumState':
@@ -35,21 +51,20 @@ class QuantumState:
         if not (0 <= l < n and abs(m) <= l):
             raise ValueError("Invalid quantum numbers")
             
-        r_points = np.linspace(0, 20, 100)
-        theta_points = np.linspace(0, np.pi, 50)
-        phi_points = np.linspace(0, 2*np.pi, 50)
-        
-        R, Theta, Phi = np.meshgrid(r_points, theta_points, phi_points)
-        
-        wf = radial_wavefunction(n, l, R) * sph_harm(m, l, Phi, Theta)
+        wf = (radial_wavefunction(n, l, R_GRID) *
+              sph_harm(m, l, PHI_GRID, THETA_GRID))
         return cls(wf, n, l, m)
 
-@jit(nopython=True)
+@lru_cache(maxsize=None)
+def _radial_coefficients(n: int, l: int) -> Tuple[float, np.poly1d]:
+    """Normalization constant and Laguerre polynomial L_{n-l-1}^{2l+1}"""
+    norm = np.sqrt((2/n)**3 * factorial(n-l-1)/(2*n*factorial(n+l)))
+    return norm, genlaguerre(n-l-1, 2*l+1)
+
 def radial_wavefunction(n: int, l: int, r: np.ndarray) -> np.ndarray:
     """Compute the radial part of the wavefunction"""
     rho = 2 * r / n
-    L = genlaguerre(n-l-1, 2*l+1)
-    norm = np.sqrt((2/n)**3 * factorial(n-l-1)/(2*n*factorial(n+l)))
+    norm, L = _radial_coefficients(n, l)
     return norm * np.exp(-rho/2) * rho**l * L(rho)
 
 class Hamiltonian:
@@ -64,10 +79,34 @@ class Hamiltonian:
         return QuantumState(-0.5 * kinetic + potential)
     
     @staticmethod
-    @jit(nopython=True)
     def _laplacian(wf: np.ndarray) -> np.ndarray:
         """Compute ∇² of wavefunction"""
-        return np.gradient(np.gradient(wf))[0]
+        if wf.ndim > 3:
+            raise ValueError("Wavefunction grids must have at most 3 dimensions")
+        # Unit axes padded onto 1-D/2-D grids contribute nothing to ∇²
+        grid = np.ascontiguousarray(wf).reshape(wf.shape + (1,) * (3 - wf.ndim))
+        return _laplacian_kernel(grid).reshape(wf.shape)
+
+@jit(nopython=True, cache=True)
+def _laplacian_kernel(wf: np.ndarray) -> np.ndarray:
+    """
+    7-point finite-difference ∇² on a 3-D grid with unit spacing
+
+    Boundary neighbours are clamped to the edge value (zero flux).
+    """
+    nx, ny, nz = wf.shape
+    out = np.empty_like(wf)
+    for i in range(nx):
+        i_lo, i_hi = max(i - 1, 0), min(i + 1, nx - 1)
+        for j in range(ny):
+            j_lo, j_hi = max(j - 1, 0), min(j + 1, ny - 1)
+            for k in range(nz):
+                k_lo, k_hi = max(k - 1, 0), min(k + 1, nz - 1)
+                out[i, j, k] = (wf[i_hi, j, k] + wf[i_lo, j, k] +
+                                wf[i, j_hi, k] + wf[i, j_lo, k] +
+                                wf[i, j, k_hi] + wf[i, j, k_lo] -
+                                6.0 * wf[i, j, k])
+    return out
 
 class Measurement:
     """Quantum measurement operations"""
@@ -76,7 +115,8 @@ class Measurement:
         
     def get_probabilities(self) -> np.ndarray:
         """Compute probability distribution |ψ|²"""
-        return np.abs(self.wf)**2
+        # Re² + Im² avoids the square root np.abs takes per element
+        return self.wf.real**2 + self.wf.imag**2
         
     def expectation_value(self, operator: np.ndarray) -> complex:
         """Compute ⟨ψ|A|ψ⟩"""
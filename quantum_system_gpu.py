@@ -41,7 +41,7 @@ class GPUQuantumState:
     def normalize(self):
         """Normalize wavefunction on GPU"""
         norm = cp.sqrt(cp.vdot(self.wf, self.wf).real)
-        self.wf /= norm
+        self.wf *= 1.0 / norm
         
     @classmethod
     def hydrogen_state(cls, n: int, l: int, m: int, 
@@ -114,16 +114,19 @@ class GPUHamiltonian:
             
             # Evolution operator factors
             k2 = self._get_momentum_squared()
-            exp_T = cp.exp(-1j * dt/2 * k2)
+            exp_T_half = cp.exp(-1j * dt/2 * k2)
+            exp_T = exp_T_half * exp_T_half
             exp_V = cp.exp(-1j * dt * self.V(state.wf))
             
-            # Time evolution loop
-            for _ in range(steps):
-                psi_k = exp_T * psi_k
+            # Time evolution loop: adjacent kinetic half-steps merge,
+            # (T½ V T½)^n = T½ V (T V)^{n-1} T½
+            for step in range(steps):
+                psi_k = (exp_T_half if step == 0 else exp_T) * psi_k
                 psi_x = fft.ifftn(psi_k)
                 psi_x = exp_V * psi_x
                 psi_k = fft.fftn(psi_x)
-                psi_k = exp_T * psi_k
+            if steps:
+                psi_k = exp_T_half * psi_k
                 
             return GPUQuantumState(fft.ifftn(psi_k))
 
@@ -138,7 +141,8 @@ class GPUMeasurement:
     def probability_density(self) -> cp.ndarray:
         """Compute |ψ|² on GPU"""
         with self.device:
-            return cp.abs(self.state.wf)**2
+            wf = self.state.wf
+            return wf.real**2 + wf.imag**2
             
     def expectation_value(self, operator: cp.ndarray) -> complex:
         """Compute ⟨ψ|A|ψ⟩ on GPU"""
@@ -150,4 +154,4 @@ class GPUMeasurement:
         """Get momentum space distribution via FFT"""
         with self.device:
             psi_k = fft.fftn(self.state.wf)
-            return cp.abs(psi_k)**2
\ No newline at end of file
+            return psi_k.real**2 + psi_k.imag**2
\ No newline at end of file
@@ -12,32 +12,35 @@ function Write-Status {
 }
 
 try {
+    $compose = @("compose", "-f", "docker-compose.integrated.yml")
+
     if ($cleanup) {
         Write-Status "Cleaning up existing containers and networks..."
-        docker-compose -f docker-compose.integrated.yml down
+        docker @compose down
         docker network prune -f
     }
 
     Write-Status "Pulling latest images..."
-    docker-compose -f docker-compose.integrated.yml pull
-
-    Write-Status "Starting core services (etcd, minio)..."
-    docker-compose -f docker-compose.integrated.yml up -d etcd minio
-
-    Write-Status "Waiting for core services initialization..."
-    Start-Sleep -Seconds 10
-
-    Write-Status "Starting Milvus standalone..."
-    docker-compose -f docker-compose.integrated.yml up -d standalone
+    docker @compose pull
 
-    Write-Status "Waiting for Milvus initialization..."
-    Start-Sleep -Seconds 15
-
-    Write-Status "Starting quantum framework services..."
+    # depends_on health conditions order etcd/minio -> standalone ->
+    # nexus_prime within a single up
+    Write-Status "Starting services..."
+    $upArgs = @("up", "-d")
     if ($forceRebuild) {
-        docker-compose -f docker-compose.integrated.yml up -d --build nexus_prime quantum_engine
-    } else {
-        docker-compose -f docker-compose.integrated.yml up -d nexus_prime quantum_engine
+        $upArgs += "--build"
+    }
+    docker @compose @upArgs
+    if ($LASTEXITCODE -ne 0) {
+        throw "docker compose up failed with exit code $LASTEXITCODE"
+    }
+
+    # Gate the deploy on the Milvus and Nexus health checks only; the
+    # Jupyter engine's health does not decide whether the stack is up
+    Write-Status "Waiting for Milvus and Nexus to become healthy..."
+    docker @compose up -d --wait standalone nexus_prime
+    if ($LASTEXITCODE -ne 0) {
+        throw "Milvus or Nexus did not become healthy (exit code $LASTEXITCODE)"
     }
 
     Write-Status "Deployment complete! Access points:"
@@ -0,0 +1,33 @@
+"""
+NEXUS_PRIME Quantum Bridge Test Framework
+----------------------------------------
+Tests precision handling of the quantum-cognitive bridge.
+"""
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+bridge = pytest.importorskip("nexus.nexus_quantum_bridge")
+QuantumCognitiveBridge = bridge.QuantumCognitiveBridge
+
+class TestQuantumCognitiveBridge:
+    @pytest.mark.parametrize("dtype", [torch.complex64, torch.complex128])
+    def test_complex_states_keep_imaginary_part(self, dtype):
+        """Test that complex quantum states are not downcast to real"""
+        qcb = QuantumCognitiveBridge(8, 8, 8, dtype=dtype)
+        state = np.exp(1j * np.linspace(0, np.pi, 8)) / np.sqrt(8)
+        q = qcb._as_state(state)
+        assert q.dtype == dtype
+        assert np.allclose(q.numpy(), state, atol=1e-6)
+
+        # A state produced by the bridge can be mapped back
+        quantum = qcb.cognitive_to_quantum(np.linspace(1.0, 2.0, 8))
+        assert np.iscomplexobj(quantum.quantum_vector)
+        cognitive = qcb.quantum_to_cognitive(quantum.quantum_vector)
+        assert np.isfinite(cognitive.coherence)
+
+    def test_real_dtype_rejected(self):
+        """Test that a real bridge dtype is rejected"""
+        with pytest.raises(ValueError):
+            QuantumCognitiveBridge(8, 8, 8, dtype=torch.float32)
@@ -0,0 +1,176 @@
+"""
+NEXUS_PRIME Server Test Framework
+--------------------------------
+Tests NexusPrime's in-process state evolution and pattern bookkeeping.
+Milvus setup is skipped, so no vector database is required.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+qt = pytest.importorskip("qutip")
+nexus_server = pytest.importorskip("nexus.nexus_server")
+NexusPrime = nexus_server.NexusPrime
+
+@pytest.fixture
+def nexus(monkeypatch):
+    """NexusPrime without a Milvus connection"""
+    monkeypatch.setattr(NexusPrime, "setup_milvus", lambda self: None)
+    monkeypatch.setenv("VECTOR_DIMENSION", "16")
+    return NexusPrime()
+
+def test_lifespan_creates_nexus_and_disconnects(monkeypatch):
+    """Test that the app lifespan creates NexusPrime and closes Milvus"""
+    testclient = pytest.importorskip("fastapi.testclient")
+    disconnected = []
+    monkeypatch.setattr(NexusPrime, "setup_milvus", lambda self: None)
+    monkeypatch.setattr(nexus_server, "start_metrics_server", lambda: None)
+    monkeypatch.setattr(nexus_server.connections, "disconnect", disconnected.append)
+    monkeypatch.setattr(nexus_server, "nexus", None)
+    monkeypatch.setenv("VECTOR_DIMENSION", "16")
+
+    with testclient.TestClient(nexus_server.app) as client:
+        assert isinstance(nexus_server.nexus, NexusPrime)
+        assert client.get("/health").status_code == 200
+    assert disconnected == ["default"]
+
+class StoredCollection:
+    """Minimal stand-in for a collection already stored in Milvus"""
+    def __init__(self, vector_type, index_type=None, dim=16):
+        self.name = "quantum_states"
+        self.schema = SimpleNamespace(
+            fields=[SimpleNamespace(name="vector", dtype=vector_type,
+                                    params={'dim': dim})]
+        )
+        self.index_type = index_type
+        self.created_index = None
+
+    def has_index(self):
+        return self.index_type is not None
+
+    def index(self):
+        return SimpleNamespace(params={'index_type': self.index_type,
+                                       'metric_type': 'L2', 'params': {}})
+
+    def create_index(self, field_name, index_params):
+        self.created_index = index_params
+
+def test_log_formatter_non_str_keys():
+    """Test that log records with non-string dict keys are serialized"""
+    record = logging.LogRecord("nexus", logging.INFO, __file__, 1,
+                               "evolved", None, None)
+    record.counts = {1: 2}
+    payload = json.loads(nexus_server.formatter.format(record))
+    assert payload["counts"] == {"1": 2}
+
+class TestNexusPrime:
+    def test_pattern_graph_is_bounded(self, nexus):
+        """Test that the synthesis graph evicts its oldest nodes"""
+        nexus.pattern_graph_max_nodes = 4
+        for k in range(10):
+            nexus.pattern_synthesis(np.array([1.0, float(k)]))
+        assert nexus.pattern_graph.number_of_nodes() <= 4
+        assert len(nexus._pattern_nodes) == nexus.pattern_graph.number_of_nodes()
+        # The most recent synthesis is kept
+        assert nexus.pattern_key(np.array([1.0, 9.0])) in nexus.pattern_graph
+
+    def test_concurrent_pattern_synthesis(self, nexus):
+        """Test that threaded syntheses keep the graph and its node order in step"""
+        nexus.pattern_graph_max_nodes = 16
+        patterns = [np.array([1.0, float(k % 40)]) for k in range(400)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(nexus.pattern_synthesis, patterns))
+        assert nexus.pattern_graph.number_of_nodes() <= 16
+        assert set(nexus._pattern_nodes) == set(nexus.pattern_graph.nodes)
+
+    @pytest.mark.parametrize("hamiltonian", [
+        qt.sigmax() + qt.sigmay() + qt.sigmaz(),
+        qt.Qobj(np.array([[1.0, 2.0], [0.5j, -1.0]])),
+    ])
+    def test_quantum_evolution_matches_expm(self, nexus, hamiltonian):
+        """Test evolution against exp(-iH·dt) for Hermitian and general H"""
+        state = qt.Qobj(np.array([[0.6], [0.8j]]))
+        evolved = nexus.quantum_evolution(state, hamiltonian, dt=0.3)
+        expected = (-1j * hamiltonian * 0.3).expm() * state
+        assert np.allclose(evolved.full(), expected.full())
+
+    def test_batch_evolution_matches_single(self, nexus):
+        """Test that batched evolution equals column-by-column evolution"""
+        hamiltonian = nexus_server.SYNTHESIS_HAMILTONIAN
+        rng = np.random.default_rng(0)
+        states = rng.normal(size=(2, 5)) + 1j * rng.normal(size=(2, 5))
+        batch = nexus.quantum_evolution_batch(states, hamiltonian)
+        for b in range(states.shape[1]):
+            single = nexus.quantum_evolution(
+                qt.Qobj(states[:, b:b + 1]), hamiltonian
+            )
+            assert np.allclose(batch[:, b:b + 1], single.full())
+
+    @pytest.mark.parametrize("states", [
+        np.ones(2, dtype=np.complex128),
+        np.ones((3, 4), dtype=np.complex128),
+    ])
+    def test_batch_evolution_rejects_bad_shape(self, nexus, states):
+        """Test that non-2D or mismatched batches are rejected"""
+        with pytest.raises(ValueError):
+            nexus.quantum_evolution_batch(states, nexus_server.SYNTHESIS_HAMILTONIAN)
+
+    def test_ivf_pq_requires_divisible_dimension(self, monkeypatch):
+        """Test that IVF_PQ rejects dimensions its sub-quantizers cannot split"""
+        monkeypatch.setattr(NexusPrime, "setup_milvus", lambda self: None)
+        monkeypatch.setenv("VECTOR_INDEX_TYPE", "IVF_PQ")
+        monkeypatch.setenv("VECTOR_DIMENSION", "20")
+        nexus = NexusPrime()
+        with pytest.raises(ValueError):
+            nexus._create_index(StoredCollection(nexus.vector_type, dim=20))
+
+        # A stored index is adopted without building, so no check applies
+        stored = StoredCollection(nexus.vector_type, 'HNSW', dim=20)
+        nexus._reuse_collection(stored)
+        assert nexus.index_type == 'HNSW'
+
+    def test_reuse_collection_adopts_stored_settings(self, nexus):
+        """Test that an existing collection's field type and index win"""
+        stored = StoredCollection(nexus_server.DataType.FLOAT16_VECTOR, 'IVF_PQ')
+        nexus._reuse_collection(stored)
+        assert nexus.vector_dtype == np.float16
+        assert nexus.index_type == 'IVF_PQ'
+        assert 'nprobe' in nexus._search_params(5)['params']
+        assert stored.created_index is None
+
+    def test_reuse_collection_creates_missing_index(self, nexus):
+        """Test that a collection left without an index gets one"""
+        stored = StoredCollection(nexus_server.DataType.FLOAT_VECTOR)
+        nexus._reuse_collection(stored)
+        assert stored.created_index == nexus.collection_params
+
+    def test_evolve_endpoint_returns_complex_parts(self, nexus, monkeypatch):
+        """Test that evolved states are returned as real and imaginary parts"""
+        testclient = pytest.importorskip("fastapi.testclient")
+        monkeypatch.setattr(nexus_server, "nexus", nexus)
+        client = testclient.TestClient(nexus_server.app)
+
+        response = client.post("/quantum/evolve", json={"state_vector": [1.0, 0.0]})
+        assert response.status_code == 200
+        body = response.json()
+        state = (np.array(body["evolved_state"]["real"])
+                 + 1j * np.array(body["evolved_state"]["imag"]))
+        expected = nexus.quantum_evolution(
+            qt.Qobj(np.array([1.0, 0.0])), nexus_server.SYNTHESIS_HAMILTONIAN
+        )
+        assert np.allclose(state, expected.full().ravel())
+
+        response = client.post("/pattern/synthesize", json={"state_vector": [0.6, 0.8]})
+        assert response.status_code == 200
+        assert len(response.json()["synthesized_pattern"]["imag"]) == 2
+
+    def test_reuse_collection_rejects_dimension_mismatch(self, nexus):
+        """Test that a stored dimension differing from VECTOR_DIMENSION fails"""
+        stored = StoredCollection(nexus_server.DataType.FLOAT_VECTOR, 'HNSW', dim=32)
+        with pytest.raises(ValueError, match="32-dim"):
+            nexus._reuse_collection(stored)
@@ -18,7 +18,9 @@ from quantum_system import QuantumState, Hamiltonian, Measurement
 
 class TestQuantumSystem:
     @given(
-        arrays(np.complex128, shape=(10,), elements=st.complex_numbers())
+        arrays(np.complex128, shape=(10,),
+               elements=st.complex_numbers(min_magnitude=1e-3,
+                                           max_magnitude=1e3))
     )
     def test_wavefunction_normalization(self, psi):
         """Test that wavefunctions are properly normalized"""
@@ -26,6 +28,16 @@ class TestQuantumSystem:
         norm = np.abs(np.vdot(state.wavefunction, state.wavefunction))
         assert np.abs(norm - 1.0) < 1e-10
 
+    @pytest.mark.parametrize("psi", [
+        np.zeros(10, dtype=np.complex128),
+        np.full(10, np.nan + 0j),
+        np.full(10, np.inf + 0j),
+    ])
+    def test_unnormalizable_wavefunction(self, psi):
+        """Test that zero or non-finite wavefunctions are rejected"""
+        with pytest.raises(ValueError):
+            QuantumState(psi)
+
     @given(
         st.integers(min_value=1, max_value=5),
         st.integers(min_value=0, max_value=4),
@@ -35,6 +47,17 @@ class TestQuantumSystem:
         """Test quantum number constraints"""
         assert abs(m) <= l < n
         
+    def test_laplacian_of_quadratic(self):
+        """Test that ∇²(x² + y² + z²) = 6 away from the grid boundary"""
+        x = np.arange(8.0)
+        X, Y, Z = np.meshgrid(x, x, x, indexing='ij')
+        lap = Hamiltonian._laplacian((X**2 + Y**2 + Z**2).astype(np.complex128))
+        assert np.allclose(lap[1:-1, 1:-1, 1:-1], 6.0)
+
+        lap_1d = Hamiltonian._laplacian(x**2)
+        assert lap_1d.shape == x.shape
+        assert np.allclose(lap_1d[1:-1], 2.0)
+        
     def test_measurement_probability(self):
         """Test that measurement probabilities sum to 1"""
         wf = np.random.randn(100) + 1j*np.random.randn(100)
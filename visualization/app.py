@@ -13,10 +13,23 @@ import numpy as np
 from dash import Dash, html, dcc
 from dash.dependencies import Input, Output, State
 import plotly.graph_objs as go
+from functools import lru_cache
 from typing import Tuple, List, Optional
 
 from quantum_system import QuantumState, Hamiltonian
 
+@lru_cache(maxsize=16)
+def _hydrogen_wavefunction(n: int, l: int, m: int) -> np.ndarray:
+    """
+    Hydrogen orbital for given quantum numbers, memoized
+
+    Revisiting a slider position does not recompute the orbital. The
+    shared array is read-only, so accidental mutation fails loudly.
+    """
+    wf = QuantumState.hydrogen_state(n, l, m).wavefunction
+    wf.setflags(write=False)
+    return wf
+
 class QuantumVisualizer:
     """
     Quantum state visualization engine with interactive dynamics
@@ -40,20 +53,25 @@ class QuantumVisualizer:
         self.phi = np.linspace(0, 2*np.pi, self.resolution)
         self.R, self.Theta, self.Phi = np.meshgrid(self.r, self.theta, self.phi)
         
+        # Cartesian surface coordinates are fixed by the grid
+        rho_xy = self.R * np.sin(self.Theta)
+        self.X = rho_xy * np.cos(self.Phi)
+        self.Y = rho_xy * np.sin(self.Phi)
+        self.Z = self.R * np.cos(self.Theta)
+        
     def compute_wavefunction(self, n: int, l: int, m: int) -> np.ndarray:
         """Generate quantum wavefunction for given quantum numbers"""
-        state = QuantumState.hydrogen_state(n, l, m)
-        return state.wavefunction
+        return _hydrogen_wavefunction(n, l, m)
         
     def plot_probability_density(self, wf: np.ndarray) -> go.Figure:
         """Create 3D visualization of probability density"""
-        rho = np.abs(wf)**2
+        rho = wf.real**2 + wf.imag**2
         
         return go.Figure(data=[
             go.Surface(
-                x=self.R * np.sin(self.Theta) * np.cos(self.Phi),
-                y=self.R * np.sin(self.Theta) * np.sin(self.Phi),
-                z=self.R * np.cos(self.Theta),
+                x=self.X,
+                y=self.Y,
+                z=self.Z,
                 surfacecolor=rho,
                 colorscale='Viridis',
                 colorbar=dict(title='|Ψ|²')